@@ -32,13 +32,14 @@ import threading
 import textwrap
 from pathlib import Path
 from datetime import datetime, date
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import contextlib
+from collections import deque
 from enum import Enum
 import signal
+import socket
 import platform
-import shutil
 
 try:
     from rich.console import Console
@@ -205,6 +206,12 @@ INTENT_KEYWORDS = [
     ("quit", "quit"),
 ]
 
+# Intents whose remainder is a chat message; bare phrases fall back to the full input
+CHAT_INTENTS = frozenset({"chat", "quick", "smart_chat"})
+
+LIST_MARKER_RE = re.compile(r"^([\d]+[\).]?|[-•])\s+")
+FILLER_WORD_RE = re.compile(r"^(for|of|the)\s+", re.IGNORECASE)
+
 DEFAULT_STRUCTURE = {
     "src": [],
     "tests": [],
@@ -231,6 +238,24 @@ TEMPLATES = {
     ".gitignore": "__pycache__/\n.env\n.vscode/\n",
 }
 
+SYSTEM_MESSAGE_STYLES = {
+    "info": ("System", "cyan"),
+    "warn": ("Notice", "yellow"),
+    "error": ("Alert", "red"),
+}
+
+PROVIDER_PROMPT_ORDER = ("groq", "openrouter", "huggingface", "together", "replicate")
+
+PROVIDER_STATUS_SYMBOLS = {
+    "healthy": "🟢",
+    "connecting": "🟡",
+    "error": "🔴",
+    "unknown": "⚪️",
+    "unconfigured": "⚪️",
+}
+
+CHAT_HISTORY_LIMIT = 1000
+
 
 def scaffold_project(base_path: str, project_name: str) -> Tuple[Path, bool]:
     """Create a new scaffolded project under base_path/project_name.
@@ -292,37 +317,24 @@ def map_to_command(user_input: str) -> str:
             return text
 
     # Remove leading bullet/numbering markers (e.g., "1.", "-", "•")
-    text = re.sub(r"^([\d]+[\).]?|[-•])\s+", "", text)
+    text = LIST_MARKER_RE.sub("", text)
 
     lower = text.lower()
     tokens = lower.split()
-    if tokens:
-        first_token = tokens[0]
-        if first_token in KNOWN_COMMANDS:
-            return text
-        # If the first token matches a known command with punctuation (e.g., "run", "create")
-        for cmd in KNOWN_COMMANDS:
-            if lower.startswith(f"{cmd} ") or lower == cmd:
-                remainder = text[len(cmd):].strip()
-                return f"{cmd} {remainder}".strip()
+    if tokens and tokens[0] in KNOWN_COMMANDS:
+        return text
 
     for phrase, command in INTENT_KEYWORDS:
-        if phrase in lower:
-            idx = lower.find(phrase)
-            remainder = text[idx + len(phrase):].strip()
-            remainder = re.sub(r"^(for|of|the)\s+", "", remainder, flags=re.IGNORECASE).strip()
-
-            if command in {"chat", "quick", "smart_chat"}:
-                message = remainder or text
-                return f"{command} {message}".strip()
-
-            if command in {"save", "run", "scaffold", "create"}:
-                return f"{command} {remainder}".strip() if remainder else command
+        idx = lower.find(phrase)
+        if idx == -1:
+            continue
+        remainder = text[idx + len(phrase):].strip()
+        remainder = FILLER_WORD_RE.sub("", remainder).strip()
 
-            if command in {"models", "providers", "health", "status", "repair", "setup_providers", "token_status"}:
-                return command if not remainder else f"{command} {remainder}".strip()
+        if command in CHAT_INTENTS:
+            remainder = remainder or text
 
-            return f"{command} {remainder}".strip()
+        return f"{command} {remainder}".strip()
 
     return text
 
@@ -381,6 +393,35 @@ class BootLoader:
         return False
 
 
+class ThreadCaptureStream:
+    """Stream proxy that routes writes from a capturing thread into that thread's buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self.stream if buffer is None else buffer
+
+    @contextlib.contextmanager
+    def capture(self, buffer: io.StringIO):
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+    def write(self, data):
+        return self._target().write(data)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
 class CodexAPIServer:
     def __init__(self, prompt: "AutonomousPrompt", host: str = "127.0.0.1", port: int = 8081):
         try:
@@ -397,6 +438,11 @@ class CodexAPIServer:
         self.site: Optional[web.TCPSite] = None
         self._shutdown = asyncio.Event()
         self.ready = asyncio.Event()
+        self._stdout: Optional[ThreadCaptureStream] = None
+        self._stderr: Optional[ThreadCaptureStream] = None
+        # Tools and codex runs share prompt/CLI state (codex history, last response,
+        # active project) that isn't thread-safe, so only one runs at a time
+        self._run_lock = threading.Lock()
 
         self.app.add_routes(
             [
@@ -409,17 +455,40 @@ class CodexAPIServer:
         )
 
     async def start(self):
-        self.runner = self.web.AppRunner(self.app)
-        await self.runner.setup()
-        self.site = self.web.TCPSite(self.runner, self.host, self.port)
-        await self.site.start()
-        self.ready.set()
-        await self._shutdown.wait()
-        await self.runner.cleanup()
+        # Swapping sys.stdout per request is process-wide and races between worker
+        # threads, so install one proxy for the server's lifetime and capture per thread
+        self._stdout = sys.stdout = ThreadCaptureStream(sys.stdout)
+        self._stderr = sys.stderr = ThreadCaptureStream(sys.stderr)
+        try:
+            self.runner = self.web.AppRunner(self.app)
+            await self.runner.setup()
+            self.site = self.web.TCPSite(self.runner, self.host, self.port)
+            await self.site.start()
+            self.ready.set()
+            await self._shutdown.wait()
+            await self.runner.cleanup()
+        finally:
+            if sys.stdout is self._stdout:
+                sys.stdout = self._stdout.stream
+            if sys.stderr is self._stderr:
+                sys.stderr = self._stderr.stream
 
     async def stop(self):
         self._shutdown.set()
 
+    def _capture(self, func: Callable, *args):
+        stdout_buf = io.StringIO()
+        stderr_buf = io.StringIO()
+        with self._run_lock, self._stdout.capture(stdout_buf), self._stderr.capture(stderr_buf):
+            result = func(*args)
+        return result, stdout_buf.getvalue(), stderr_buf.getvalue()
+
+    async def _run_blocking(self, func: Callable, *args):
+        # Tools and codex runs block on subprocesses and HTTP; keep them off the event loop
+        # (they still run one at a time, see _run_lock)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._capture, func, *args)
+
     async def _handle_health(self, request):
         data = {
             "state": self.prompt.cli.state.value,
@@ -436,16 +505,13 @@ class CodexAPIServer:
         payload = await request.json()
         args = payload.get("arguments", "")
         name = request.match_info["name"]
-        stdout_buf = io.StringIO()
-        stderr_buf = io.StringIO()
-        with contextlib.redirect_stdout(stdout_buf), contextlib.redirect_stderr(stderr_buf):
-            result = self.prompt._invoke_tool(name, args)
+        result, stdout, stderr = await self._run_blocking(self.prompt._invoke_tool, name, args)
         response = {
             "success": result.success,
             "message": result.message,
             "data": result.data,
-            "stdout": stdout_buf.getvalue(),
-            "stderr": stderr_buf.getvalue(),
+            "stdout": stdout,
+            "stderr": stderr,
         }
         status = 200 if result.success else 400
         return self.web.json_response(response, status=status)
@@ -455,16 +521,13 @@ class CodexAPIServer:
         goal = payload.get("goal")
         if not goal:
             return self.web.json_response({"error": "Missing goal"}, status=400)
-        stdout_buf = io.StringIO()
-        stderr_buf = io.StringIO()
-        with contextlib.redirect_stdout(stdout_buf), contextlib.redirect_stderr(stderr_buf):
-            result = self.prompt._codex_execute(goal, verbose=False)
+        result, stdout, stderr = await self._run_blocking(self.prompt._codex_execute, goal, False)
         response = {
             "success": result["success"],
             "message": result.get("message"),
             "data": result.get("data"),
-            "stdout": stdout_buf.getvalue(),
-            "stderr": stderr_buf.getvalue(),
+            "stdout": stdout,
+            "stderr": stderr,
         }
         status = 200 if result["success"] else 400
         return self.web.json_response(response, status=status)
@@ -542,7 +605,7 @@ class AutonomousPrompt(cmd.Cmd):
             self.immersive_mode = force_immersive.lower() in {"1", "true", "yes", "on"}
         else:
             self.immersive_mode = bool(RICH_AVAILABLE and getattr(console, "is_terminal", True))
-        self.chat_history: List[Tuple[str, str]] = []
+        self.chat_history: Deque[Tuple[str, str]] = deque(maxlen=CHAT_HISTORY_LIMIT)
         self._immersive_intro_shown = False
         self._readline = None
 
@@ -715,12 +778,7 @@ class AutonomousPrompt(cmd.Cmd):
             print(message)
             return
 
-        palette = {
-            "info": ("System", "cyan"),
-            "warn": ("Notice", "yellow"),
-            "error": ("Alert", "red"),
-        }
-        title, border = palette.get(level, ("System", "cyan"))
+        title, border = SYSTEM_MESSAGE_STYLES.get(level, SYSTEM_MESSAGE_STYLES["info"])
         console.print(self._build_message_panel(title, message, border))
 
     def preloop(self) -> None:
@@ -1120,13 +1178,7 @@ class AutonomousPrompt(cmd.Cmd):
             os.environ[env_key] = value
             return
 
-        if key == "local_enabled":
-            serialized = "1" if value else "0"
-            self.cli.env_manager.write_secret(env_key, serialized)
-            os.environ[env_key] = serialized
-            return
-
-        if key == "health_checks":
+        if key in {"local_enabled", "health_checks"}:
             serialized = "1" if value else "0"
             self.cli.env_manager.write_secret(env_key, serialized)
             os.environ[env_key] = serialized
@@ -1173,6 +1225,7 @@ class AutonomousPrompt(cmd.Cmd):
         args = shlex.split(arg)
         host = "127.0.0.1"
         port = 8081
+        port_text = None
         stop = False
 
         idx = 0
@@ -1186,15 +1239,24 @@ class AutonomousPrompt(cmd.Cmd):
                 idx += 1
                 host = args[idx]
             elif token.startswith("--port="):
-                port = int(token.split("=", 1)[1])
+                port_text = token.split("=", 1)[1]
             elif token == "--port" and idx + 1 < len(args):
                 idx += 1
-                port = int(args[idx])
+                port_text = args[idx]
             else:
                 print(f"Unrecognized argument: {token}")
                 return
             idx += 1
 
+        if port_text is not None:
+            try:
+                port = int(port_text)
+            except ValueError:
+                port = 0
+            if not 0 < port < 65536:
+                print(f"Invalid port: {port_text} (expected 1-65535)")
+                return
+
         try:
             if stop:
                 message = asyncio.run(self.cli.stop_api_server())
@@ -1204,9 +1266,6 @@ class AutonomousPrompt(cmd.Cmd):
         except Exception as exc:
             print(f"❌ API server error: {exc}")
 
-    def do_pulse(self, arg):
-        self._invoke_tool("pulse", arg)
-
     def _codex_execute(self, goal: str, verbose: bool = True) -> Dict[str, any]:
         transcript: List[str] = []
 
@@ -1371,17 +1430,11 @@ class AutonomousPrompt(cmd.Cmd):
         return (Path.cwd() / path).resolve()
 
     def _maybe_run_shell(self, command: str) -> bool:
-        try:
-            import shlex
-        except ImportError:
-            shlex = None
-
         tokens = []
-        if shlex:
-            try:
-                tokens = shlex.split(command)
-            except ValueError:
-                pass
+        try:
+            tokens = shlex.split(command)
+        except ValueError:
+            pass
         if not tokens:
             tokens = command.split()
         if not tokens:
@@ -1654,21 +1707,13 @@ class AutonomousPrompt(cmd.Cmd):
     def _provider_prompt(self) -> str:
         manager = self.cli.provider_manager
         summary_parts = []
-        order = ["groq", "openrouter", "huggingface", "together", "replicate"]
-        for key in order:
+        for key in PROVIDER_PROMPT_ORDER:
             if key not in manager.catalog:
                 continue
             state = manager.status.get(
                 key, "unconfigured" if key not in manager.providers else "unknown"
             )
-            symbol = {
-                "healthy": "🟢",
-                "connecting": "🟡",
-                "error": "🔴",
-                "unknown": "⚪️",
-                "unconfigured": "⚪️",
-            }.get(state, "⚪️")
-            summary_parts.append(symbol)
+            summary_parts.append(PROVIDER_STATUS_SYMBOLS.get(state, "⚪️"))
         return "".join(summary_parts) + (" " if summary_parts else "")
 
     def _format_tool_catalog(self) -> str:
@@ -1963,7 +2008,7 @@ class AutonomousCLI:
     def __init__(self):
         self.state = AutonomousState.INITIALIZING
         self.health = SystemHealth()
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.project_root = Path(__file__).resolve().parent
         preferred_config_dir = Path.home() / ".ai_cli_autonomous"
         fallback_config_dir = self.project_root / ".ai_cli_autonomous_local"
@@ -1998,16 +2043,29 @@ class AutonomousCLI:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         entry = f"[{timestamp}] [{level}] {message}"
         print(entry)
+        if self._log_handle is None:
+            return
         try:
-            with open(self.log_file, "a") as f:
-                f.write(entry + "\n")
+            self._log_handle.write(entry + "\n")
         except:
             pass
 
     def _setup_logging(self):
-        if not self.log_file.exists():
-            with open(self.log_file, "w") as f:
-                f.write(f"# Log started: {datetime.now()}\n\n")
+        # Keep one line-buffered handle open rather than reopening the file per entry;
+        # logging stays best-effort, so an unwritable log file doesn't stop startup
+        self._log_handle = None
+        try:
+            new_log = not self.log_file.exists()
+            self._log_handle = open(self.log_file, "a", buffering=1)
+            if new_log:
+                self._log_handle.write(f"# Log started: {datetime.now()}\n\n")
+        except:
+            pass
+
+    def _close_logging(self):
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
 
     def provider_filter_mode(self) -> str:
         allowed = self.provider_manager.allowed_providers
@@ -2059,6 +2117,7 @@ class AutonomousCLI:
     def _graceful_shutdown(self):
         self.log("🛑 Graceful shutdown...", "INFO")
         self.save_health_state()
+        self._close_logging()
         sys.exit(0)
 
     async def autonomous_startup(self):
@@ -2169,10 +2228,12 @@ class AutonomousCLI:
         except: return False
     async def _test_net(self):
         hosts = [("8.8.8.8", 53), ("1.1.1.1", 53), ("google.com", 443)]
+        loop = asyncio.get_running_loop()
         for host, port in hosts:
             try:
-                import socket
-                socket.create_connection((host, port), 5)
+                # Connect off the event loop so a slow DNS/TCP handshake doesn't stall it
+                conn = await loop.run_in_executor(None, socket.create_connection, (host, port), 5)
+                conn.close()
                 self.log(f"✅ Network connection to {host}:{port} successful.")
                 self._network_warned = False
                 return True
@@ -2251,7 +2312,7 @@ def status():
 if __name__=="__main__":app()""")
         except PermissionError as exc:
             self.log(f"⚠️ Unable to write user-ready artifacts: {exc}", "WARNING")
-        self.health.uptime=time.time()-self.start_time
+        self.health.uptime=time.monotonic()-self.start_time
         self.save_health_state()
         self.log("✅ Ready")
 
@@ -2284,7 +2345,7 @@ if __name__=="__main__":app()""")
         self.health.providers_accessible = providers_ok
         self.health.config_valid = config_ok
         self.health.last_check = datetime.now()
-        self.health.uptime = time.time() - self.start_time
+        self.health.uptime = time.monotonic() - self.start_time
 
         checks = {
             "dependencies": dependency_ok,
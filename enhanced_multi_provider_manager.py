@@ -6,20 +6,18 @@ streamlit GUI for better stability, and enhanced error handling.
 """
 
 import os
-import sys
 import json
 import time
+import random
 import threading
 import requests
-import streamlit as st
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 import base64
 from cryptography.fernet import Fernet
-import hashlib
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # Configure logging
@@ -34,12 +32,45 @@ except ImportError:
     RAG_AVAILABLE = False
     logger.warning("RAG assistant not available - install required dependencies")
 
+# Optional fast JSON backend
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (config files, API responses), using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=2, default=str).encode()
+
 class ProviderStatus(Enum):
     ACTIVE = "active"
     EXHAUSTED = "exhausted" 
     ERROR = "error"
     DISABLED = "disabled"
 
+# Status lookup by stored string value
+STATUS_BY_VALUE = {status.value: status for status in ProviderStatus}
+
+# HTTP status codes that mean a provider's quota or credit is used up
+QUOTA_STATUS_CODES = frozenset({402, 429})
+
+# Sidebar indicator for each status value
+STATUS_ICONS = {
+    ProviderStatus.ACTIVE.value: '🟢',
+    ProviderStatus.EXHAUSTED.value: '🟡',
+    ProviderStatus.ERROR.value: '🔴',
+    ProviderStatus.DISABLED.value: '⚪'
+}
+
 @dataclass
 class TokenUsage:
     prompt_tokens: int = 0
@@ -65,17 +96,24 @@ class ProviderConfig:
         if self.usage is None:
             self.usage = TokenUsage(last_reset=datetime.now())
 
+# Field names accepted when restoring saved configs
+TOKEN_USAGE_FIELDS = frozenset(f.name for f in fields(TokenUsage))
+PROVIDER_CONFIG_FIELDS = frozenset(f.name for f in fields(ProviderConfig))
+
 class SecureStorage:
     """Secure storage for API keys using encryption"""
     
+    # Fernet instances keyed by key file path, so the key is read once per process
+    _fernet_cache: Dict[str, Fernet] = {}
+    
     @staticmethod
     def _get_key() -> bytes:
         """Generate or retrieve encryption key"""
         key_file = os.path.expanduser("~/.token_manager_key")
-        if os.path.exists(key_file):
+        try:
             with open(key_file, 'rb') as f:
                 return f.read()
-        else:
+        except FileNotFoundError:
             key = Fernet.generate_key()
             os.makedirs(os.path.dirname(key_file), exist_ok=True)
             with open(key_file, 'wb') as f:
@@ -83,13 +121,22 @@ class SecureStorage:
             os.chmod(key_file, 0o600)  # Restrict permissions
             return key
     
+    @staticmethod
+    def _get_fernet() -> Fernet:
+        """Get cached Fernet instance for the current key file"""
+        key_file = os.path.expanduser("~/.token_manager_key")
+        fernet = SecureStorage._fernet_cache.get(key_file)
+        if fernet is None:
+            fernet = Fernet(SecureStorage._get_key())
+            SecureStorage._fernet_cache[key_file] = fernet
+        return fernet
+    
     @staticmethod
     def encrypt_api_key(api_key: str) -> str:
         """Encrypt API key for storage"""
         if not api_key:
             return ""
-        key = SecureStorage._get_key()
-        fernet = Fernet(key)
+        fernet = SecureStorage._get_fernet()
         encrypted = fernet.encrypt(api_key.encode())
         return base64.urlsafe_b64encode(encrypted).decode()
     
@@ -99,8 +146,7 @@ class SecureStorage:
         if not encrypted_key:
             return ""
         try:
-            key = SecureStorage._get_key()
-            fernet = Fernet(key)
+            fernet = SecureStorage._get_fernet()
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_key.encode())
             decrypted = fernet.decrypt(encrypted_bytes)
             return decrypted.decode()
@@ -114,6 +160,8 @@ class APIProvider:
     def __init__(self, config: ProviderConfig):
         self.config = config
         self._decrypted_key = None
+        self._request_headers = None
+        self.session = requests.Session()  # Reuse keep-alive connections across calls
     
     @property
     def api_key(self) -> str:
@@ -126,6 +174,15 @@ class APIProvider:
         """Set and encrypt API key"""
         self.config.api_key_encrypted = SecureStorage.encrypt_api_key(api_key)
         self._decrypted_key = api_key
+        self._request_headers = None
+    
+    def _auth_headers(self) -> Dict[str, str]:
+        """Get request headers with authorization (built once per API key)"""
+        if self._request_headers is None:
+            headers = self.config.headers.copy()
+            headers['Authorization'] = f"Bearer {self.api_key}"
+            self._request_headers = headers
+        return self._request_headers
     
     def is_available(self) -> bool:
         """Check if provider is available for requests"""
@@ -151,28 +208,27 @@ class APIProvider:
     def make_request(self, endpoint: str, data: Dict, timeout: int = 60) -> Tuple[Dict, Optional[str]]:
         """Make API request with error handling"""
         try:
-            headers = self.config.headers.copy()
-            headers['Authorization'] = f"Bearer {self.api_key}"
-            
-            response = requests.post(
+            response = self.session.post(
                 f"{self.config.base_url}/{endpoint}",
-                headers=headers,
+                headers=self._auth_headers(),
                 json=data,
                 timeout=timeout
             )
             
             self.config.usage.requests += 1
             
-            if response.status_code == 401:
-                self.config.status = ProviderStatus.ERROR
-                return {}, "Invalid API key"
-            elif response.status_code in [402, 429]:
-                self.config.status = ProviderStatus.EXHAUSTED
-                return {}, f"Quota exhausted (HTTP {response.status_code})"
-            elif response.status_code >= 400:
-                return {}, f"HTTP {response.status_code}: {response.text}"
+            # Successful responses skip the error classification entirely
+            status_code = response.status_code
+            if status_code >= 400:
+                if status_code == 401:
+                    self.config.status = ProviderStatus.ERROR
+                    return {}, "Invalid API key"
+                if status_code in QUOTA_STATUS_CODES:
+                    self.config.status = ProviderStatus.EXHAUSTED
+                    return {}, f"Quota exhausted (HTTP {status_code})"
+                return {}, f"HTTP {status_code}: {response.text}"
             
-            result = response.json()
+            result = _json_loads(response.content)
             
             # Update token usage if available
             if 'usage' in result:
@@ -193,12 +249,9 @@ class APIProvider:
     def get_models(self) -> Tuple[List[Dict], Optional[str]]:
         """Get available models from provider"""
         try:
-            headers = {'Authorization': f"Bearer {self.api_key}"}
-            headers.update(self.config.headers)
-            
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config.base_url}/{self.config.models_endpoint}",
-                headers=headers,
+                headers=self._auth_headers(),
                 timeout=30
             )
             
@@ -206,7 +259,7 @@ class APIProvider:
                 logger.error(f"Provider {self.config.name} failed to fetch models: HTTP {response.status_code}")
                 return [], f"Failed to fetch models: HTTP {response.status_code} - {response.text}"
             
-            data = response.json()
+            data = _json_loads(response.content)
             models = data.get('models', data.get('data', []))
             
             if not isinstance(models, list):
@@ -270,26 +323,25 @@ class HuggingFaceProvider(APIProvider):
     def get_models(self) -> Tuple[List[Dict], Optional[str]]:
         """Get available text generation models from HuggingFace"""
         try:
-            headers = {'Authorization': f"Bearer {self.api_key}"}
-            
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config.base_url}/{self.config.models_endpoint}",
-                headers=headers,
+                headers=self._auth_headers(),
                 timeout=30
             )
             
             if response.status_code != 200:
                 return [], f"Failed to fetch models: HTTP {response.status_code} - {response.text}"
             
-            models_data = response.json()
+            models_data = _json_loads(response.content)
             
             # Transform HF model format to standard format
             models = []
             for model in models_data:
                 if isinstance(model, dict):
+                    model_id = model.get('id', model.get('modelId', 'unknown'))
                     models.append({
-                        'id': model.get('id', model.get('modelId', 'unknown')),
-                        'name': model.get('id', model.get('modelId', 'unknown')),
+                        'id': model_id,
+                        'name': model_id,
                         'description': f"Downloads: {model.get('downloads', 0)}, Likes: {model.get('likes', 0)}"
                     })
             
@@ -302,23 +354,22 @@ class HuggingFaceProvider(APIProvider):
     def send_chat(self, model_id: str, messages: List[Dict]) -> Tuple[Dict, Optional[str]]:
         """Send request to Hugging Face model with improved error handling"""
         # Convert messages to prompt for HF
-        prompt = ""
-        for msg in messages:
-            role = msg.get('role', 'user')
-            content = msg.get('content', '')
-            prompt += f"{role}: {content}\n"
+        prompt = "".join(
+            f"{msg.get('role', 'user')}: {msg.get('content', '')}\n"
+            for msg in messages
+        )
         
         data = {"inputs": prompt, "parameters": {"max_new_tokens": 100, "return_full_text": False}}
         endpoint = f"models/{model_id}"
+        prompt_tokens = len(prompt.split())  # Prompt is fixed across retries
+        url = f"{self.config.base_url}/{endpoint}"
+        headers = self._auth_headers()
         
         MAX_RETRIES = 3
         for attempt in range(MAX_RETRIES):
             try:
-                headers = self.config.headers.copy()
-                headers['Authorization'] = f"Bearer {self.api_key}"
-                
-                response = requests.post(
-                    f"{self.config.base_url}/{endpoint}",
+                response = self.session.post(
+                    url,
                     headers=headers,
                     json=data,
                     timeout=60
@@ -326,8 +377,9 @@ class HuggingFaceProvider(APIProvider):
                 
                 if response.status_code == 503:
                     if attempt < MAX_RETRIES - 1:
-                        wait_time = 2 ** attempt
-                        logger.warning(f"HF model {model_id} is loading (503). Retrying in {wait_time}s...")
+                        # Jittered exponential backoff so concurrent clients don't retry in lockstep
+                        wait_time = (2 ** attempt) * random.uniform(0.5, 1.5)
+                        logger.warning(f"HF model {model_id} is loading (503). Retrying in {wait_time:.1f}s...")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -336,12 +388,13 @@ class HuggingFaceProvider(APIProvider):
                 if response.status_code != 200:
                     return {}, f"HTTP {response.status_code}: {response.text}"
                 
-                result = response.json()
+                result = _json_loads(response.content)
                 self.config.usage.requests += 1
                 
                 # Convert HF response to standard format
                 if isinstance(result, list) and len(result) > 0:
                     generated_text = result[0].get('generated_text', '')
+                    completion_tokens = len(generated_text.split())
                     standardized = {
                         'choices': [{
                             'message': {
@@ -350,9 +403,9 @@ class HuggingFaceProvider(APIProvider):
                             }
                         }],
                         'usage': {
-                            'prompt_tokens': len(prompt.split()),
-                            'completion_tokens': len(generated_text.split()),
-                            'total_tokens': len(prompt.split()) + len(generated_text.split())
+                            'prompt_tokens': prompt_tokens,
+                            'completion_tokens': completion_tokens,
+                            'total_tokens': prompt_tokens + completion_tokens
                         }
                     }
                     
@@ -394,6 +447,13 @@ class TogetherAIProvider(APIProvider):
         if api_key:
             self.set_api_key(api_key)
 
+# Provider classes by display name, used when restoring configs and adding providers
+PROVIDER_CLASSES = {
+    "OpenRouter": OpenRouterProvider,
+    "Hugging Face": HuggingFaceProvider,
+    "Together AI": TogetherAIProvider
+}
+
 class EnhancedTokenManager:
     """Enhanced token management system with persistence"""
     
@@ -443,8 +503,9 @@ class EnhancedTokenManager:
                     models = future.result(timeout=10)
                     if models:
                         self.cached_models = models
-                        self.cache_timestamp = datetime.now()
-                        self.last_auto_refresh = datetime.now()
+                        refreshed_at = datetime.now()
+                        self.cache_timestamp = refreshed_at
+                        self.last_auto_refresh = refreshed_at
                     return models or self.cached_models or {}
                 except FutureTimeoutError:
                     logger.warning("Background model refresh timed out, using cached data")
@@ -538,11 +599,15 @@ class EnhancedTokenManager:
         return response, error, provider.config.name
     
     def get_all_models(self) -> Dict[str, List[Dict]]:
-        """Get models from all providers"""
+        """Get models from all providers (fetched concurrently)"""
         all_models = {}
-        for provider in self.providers:
-            if provider.config.status == ProviderStatus.ACTIVE and provider.api_key:
-                models, error = provider.get_models()
+        active = [p for p in self.providers if p.config.status == ProviderStatus.ACTIVE and p.api_key]
+        if not active:
+            return all_models
+        
+        with ThreadPoolExecutor(max_workers=len(active)) as executor:
+            results = executor.map(lambda p: p.get_models(), active)
+            for provider, (models, error) in zip(active, results):
                 if not error:
                     all_models[provider.config.name] = models
                 else:
@@ -551,9 +616,8 @@ class EnhancedTokenManager:
     
     def get_provider_status(self) -> List[Dict]:
         """Get status of all providers"""
-        status_list = []
-        for provider in self.providers:
-            status_list.append({
+        return [
+            {
                 'name': provider.config.name,
                 'status': provider.config.status.value,
                 'requests': provider.config.usage.requests,
@@ -561,8 +625,9 @@ class EnhancedTokenManager:
                 'rate_limit': provider.config.rate_limit,
                 'token_limit': provider.config.token_limit,
                 'has_key': bool(provider.api_key)
-            })
-        return status_list
+            }
+            for provider in self.providers
+        ]
     
     def save_config(self):
         """Save configuration to file"""
@@ -586,8 +651,8 @@ class EnhancedTokenManager:
         
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2, default=str)
+            with open(self.config_file, 'wb') as f:
+                f.write(_json_dumps(config_data))
             os.chmod(self.config_file, 0o600)  # Restrict permissions
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
@@ -595,86 +660,84 @@ class EnhancedTokenManager:
     def load_config(self):
         """Load configuration from file with backward compatibility"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                
-                self.current_provider_index = config_data.get('current_provider_index', 0)
-                
-                # Restore providers
-                for provider_data in config_data.get('providers', []):
-                    try:
-                        # Handle backward compatibility for usage field
-                        if 'usage' in provider_data and isinstance(provider_data['usage'], dict):
-                            usage_dict = provider_data['usage']
-                            
-                            # Remove any fields that are not in current TokenUsage dataclass
-                            valid_fields = {'prompt_tokens', 'completion_tokens', 'total_tokens', 'requests', 'last_reset'}
-                            usage_dict = {k: v for k, v in usage_dict.items() if k in valid_fields}
-                            
-                            # Convert string back to datetime
-                            if usage_dict.get('last_reset'):
-                                usage_dict['last_reset'] = datetime.fromisoformat(usage_dict['last_reset'])
-                            
-                            # Create TokenUsage object
-                            provider_data['usage'] = TokenUsage(**usage_dict)
-                        
-                        # Convert string status to enum with validation
-                        if 'status' in provider_data and isinstance(provider_data['status'], str):
-                            # Handle both "active" and "ProviderStatus.ACTIVE" formats
-                            status_str = provider_data['status'].split('.')[-1] if '.' in provider_data['status'] else provider_data['status']
-                            
-                            # Validate status value
-                            try:
-                                provider_data['status'] = ProviderStatus(status_str)
-                            except ValueError:
-                                # If invalid status, default to ACTIVE
-                                logger.warning(f"Invalid status '{status_str}' for provider, defaulting to ACTIVE")
-                                provider_data['status'] = ProviderStatus.ACTIVE
-                        
-                        # Handle backward compatibility for api_key field
-                        if 'api_key' in provider_data and 'api_key_encrypted' not in provider_data:
-                            provider_data['api_key_encrypted'] = provider_data.pop('api_key')
-                        
-                        # Ensure api_key_encrypted exists
-                        if 'api_key_encrypted' not in provider_data:
-                            provider_data['api_key_encrypted'] = ""
-                        
-                        # Create provider based on name
-                        if provider_data['name'] == 'OpenRouter':
-                            provider = OpenRouterProvider()
-                        elif provider_data['name'] == 'Hugging Face':
-                            provider = HuggingFaceProvider()
-                        elif provider_data['name'] == 'Together AI':
-                            provider = TogetherAIProvider()
-                        elif provider_data['name'] == 'Exo Local':
-                            # Skip Exo Local if exo_provider is not available
-                            logger.info("Skipping Exo Local provider (requires exo_provider module)")
-                            continue
-                        else:
-                            logger.warning(f"Unknown provider type: {provider_data['name']}")
-                            continue
+            with open(self.config_file, 'rb') as f:
+                config_data = _json_loads(f.read())
+        except FileNotFoundError:
+            return  # No saved config yet
+        except Exception as e:
+            logger.error(f"Failed to load config: {e}")
+            return
+        
+        try:
+            self.current_provider_index = config_data.get('current_provider_index', 0)
+            
+            # Restore providers
+            for provider_data in config_data.get('providers', []):
+                try:
+                    # Handle backward compatibility for usage field
+                    if 'usage' in provider_data and isinstance(provider_data['usage'], dict):
+                        usage_dict = provider_data['usage']
                         
-                        # Restore config - only include fields that exist in ProviderConfig
-                        valid_config_fields = {
-                            'name', 'api_key_encrypted', 'base_url', 'models_endpoint', 
-                            'chat_endpoint', 'headers', 'rate_limit', 'token_limit', 
-                            'status', 'usage'
-                        }
-                        filtered_data = {k: v for k, v in provider_data.items() if k in valid_config_fields}
+                        # Remove any fields that are not in current TokenUsage dataclass
+                        usage_dict = {k: v for k, v in usage_dict.items() if k in TOKEN_USAGE_FIELDS}
                         
-                        provider.config = ProviderConfig(**filtered_data)
-                        self.providers.append(provider)
+                        # Convert string back to datetime
+                        if usage_dict.get('last_reset'):
+                            usage_dict['last_reset'] = datetime.fromisoformat(usage_dict['last_reset'])
                         
-                    except Exception as e:
-                        logger.error(f"Failed to restore provider {provider_data.get('name', 'unknown')}: {e}")
+                        # Create TokenUsage object
+                        provider_data['usage'] = TokenUsage(**usage_dict)
+                    
+                    # Convert string status to enum with validation
+                    if 'status' in provider_data and isinstance(provider_data['status'], str):
+                        # Handle both "active" and "ProviderStatus.ACTIVE" formats
+                        status_str = provider_data['status'].split('.')[-1] if '.' in provider_data['status'] else provider_data['status']
                         
+                        # Validate status value
+                        status = STATUS_BY_VALUE.get(status_str)
+                        if status is None:
+                            # If invalid status, default to ACTIVE
+                            logger.warning(f"Invalid status '{status_str}' for provider, defaulting to ACTIVE")
+                            status = ProviderStatus.ACTIVE
+                        provider_data['status'] = status
+                    
+                    # Handle backward compatibility for api_key field
+                    if 'api_key' in provider_data and 'api_key_encrypted' not in provider_data:
+                        provider_data['api_key_encrypted'] = provider_data.pop('api_key')
+                    
+                    # Ensure api_key_encrypted exists
+                    if 'api_key_encrypted' not in provider_data:
+                        provider_data['api_key_encrypted'] = ""
+                    
+                    # Create provider based on name
+                    provider_class = PROVIDER_CLASSES.get(provider_data['name'])
+                    if provider_class is not None:
+                        provider = provider_class()
+                    elif provider_data['name'] == 'Exo Local':
+                        # Skip Exo Local if exo_provider is not available
+                        logger.info("Skipping Exo Local provider (requires exo_provider module)")
+                        continue
+                    else:
+                        logger.warning(f"Unknown provider type: {provider_data['name']}")
+                        continue
+                    
+                    # Restore config - only include fields that exist in ProviderConfig
+                    filtered_data = {k: v for k, v in provider_data.items() if k in PROVIDER_CONFIG_FIELDS}
+                    
+                    provider.config = ProviderConfig(**filtered_data)
+                    self.providers.append(provider)
+                    
+                except Exception as e:
+                    logger.error(f"Failed to restore provider {provider_data.get('name', 'unknown')}: {e}")
+                    
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
 
 # Streamlit GUI
 def main():
     """Streamlit GUI for the Enhanced Multi-Provider Token Manager"""
+    # Imported here so CLI tools using the manager don't pay streamlit's import cost
+    import streamlit as st
     
     st.set_page_config(
         page_title="Enhanced Multi-Provider Token Manager",
@@ -723,7 +786,7 @@ def main():
         with st.expander("Add New Provider", expanded=False):
             provider_type = st.selectbox(
                 "Provider Type",
-                ["OpenRouter", "Hugging Face", "Together AI"]
+                list(PROVIDER_CLASSES)
             )
             
             api_key = st.text_input(
@@ -735,13 +798,7 @@ def main():
             if st.button("Add Provider", type="primary"):
                 if api_key:
                     try:
-                        if provider_type == "OpenRouter":
-                            provider = OpenRouterProvider(api_key)
-                        elif provider_type == "Hugging Face":
-                            provider = HuggingFaceProvider(api_key)
-                        elif provider_type == "Together AI":
-                            provider = TogetherAIProvider(api_key)
-                        
+                        provider = PROVIDER_CLASSES[provider_type](api_key)
                         token_manager.add_provider(provider)
                         st.success(f"Added {provider_type} provider successfully!")
                         st.rerun()
@@ -789,17 +846,11 @@ def main():
                 col1, col2, col3 = st.columns([2, 1, 1])
                 
                 with col1:
-                    status_color = {
-                        'active': '🟢',
-                        'exhausted': '🟡',
-                        'error': '🔴',
-                        'disabled': '⚪'
-                    }
                     key_indicator = "🔑" if provider['has_key'] else "❌"
                     # Show if this is the current provider
                     is_current = (idx == token_manager.current_provider_index)
                     current_marker = " ⭐" if is_current else ""
-                    st.write(f"{status_color.get(provider['status'], '⚪')} {key_indicator} **{provider['name']}**{current_marker}")
+                    st.write(f"{STATUS_ICONS.get(provider['status'], '⚪')} {key_indicator} **{provider['name']}**{current_marker}")
                 
                 with col2:
                     st.write(f"Req: {provider['requests']}/{provider['rate_limit']}")
@@ -912,8 +963,7 @@ def main():
             help="Select a model to chat with"
         )
         
-        # Current provider info
-        current_provider = token_manager.get_current_provider()
+        # Current provider info (provider changes above trigger a rerun, so reuse the lookup)
         if current_provider:
             key_status = "🔑 Key configured" if current_provider.api_key else "❌ No API key"
             st.info(f"**Current Provider:** {current_provider.config.name} | {key_status}")
@@ -1059,14 +1109,16 @@ def main():
         
         # Show auto-refresh status
         if token_manager.last_auto_refresh:
-            time_since = (datetime.now() - token_manager.last_auto_refresh).total_seconds()
+            now = datetime.now()
+            time_since = (now - token_manager.last_auto_refresh).total_seconds()
             next_refresh_in = max(0, token_manager.auto_refresh_interval - time_since)
+            cache_fresh = token_manager.cache_timestamp and (now - token_manager.cache_timestamp).total_seconds() < 300
             
             st.info(f"""
             **Auto-refresh status:**
             - Last refresh: {int(time_since//60)} minutes ago
             - Next refresh: in {int(next_refresh_in//60)} minutes
-            - Cache: {'Fresh ✓' if token_manager.cache_timestamp and (datetime.now() - token_manager.cache_timestamp).total_seconds() < 300 else 'Outdated'}
+            - Cache: {'Fresh ✓' if cache_fresh else 'Outdated'}
             """)
         else:
             st.info("Auto-refresh will run soon...")
@@ -1096,8 +1148,8 @@ def main():
         with st.expander("View Raw Configuration"):
             try:
                 if os.path.exists(token_manager.config_file):
-                    with open(token_manager.config_file, 'r') as f:
-                        config_data = json.load(f)
+                    with open(token_manager.config_file, 'rb') as f:
+                        config_data = _json_loads(f.read())
                     st.json(config_data)
                 else:
                     st.info("No configuration file found")
@@ -1111,15 +1163,13 @@ def main():
             st.warning("⚠️ RAG Assistant not available. The rag_assistant.py module is required.")
             st.info("The assistant uses documentation to answer questions about setup, usage, and troubleshooting.")
         else:
-            # Initialize RAG system
+            # Initialize RAG system (documentation is indexed on first search)
             if 'rag_system' not in st.session_state:
-                with st.spinner("Loading documentation..."):
-                    st.session_state.rag_system = SimpleRAG()
-                    st.session_state.rag_system.load_documents()
-                    st.session_state.rag_assistant = EnhancedRAGAssistant(
-                        st.session_state.rag_system,
-                        token_manager
-                    )
+                st.session_state.rag_system = SimpleRAG()
+                st.session_state.rag_assistant = EnhancedRAGAssistant(
+                    st.session_state.rag_system,
+                    token_manager
+                )
             
             rag_assistant = st.session_state.rag_assistant
             
@@ -1210,7 +1260,9 @@ def main():
             # Documentation stats
             st.divider()
             with st.expander("📊 Documentation Stats"):
-                if 'rag_system' in st.session_state:
+                if 'rag_system' in st.session_state and not st.session_state.rag_system.is_loaded:
+                    st.info("Documentation is indexed when you ask your first question")
+                elif 'rag_system' in st.session_state:
                     rag = st.session_state.rag_system
                     st.metric("Indexed Documents", len(rag.documents))
                     st.metric("Unique Keywords", len(rag.index))
@@ -1225,6 +1277,8 @@ def main():
                         st.write(f"- {source}: {count} chunks")
 
 if __name__ == "__main__":
+    import streamlit as st
+    
     try:
         main()
     except Exception as e:
@@ -6,6 +6,7 @@ Seamlessly integrates Exo local cluster as a provider alongside
 OpenRouter, Hugging Face, and other cloud providers.
 """
 
+import os
 import json
 import logging
 from typing import Dict, List, Optional, Tuple, Any
@@ -107,7 +108,6 @@ class ExoTokenManagerIntegration:
         """
         try:
             # Load existing config
-            import os
             config_file = os.path.expanduser(self.config_path)
             
             if os.path.exists(config_file):
@@ -116,19 +116,17 @@ class ExoTokenManagerIntegration:
             else:
                 config = {"providers": [], "current_provider_index": 0}
             
-            # Check if Exo already exists
-            exo_exists = any(
-                p.get("name") == "Exo Local" 
-                for p in config.get("providers", [])
+            # Find existing Exo entry in a single pass
+            exo_index = next(
+                (i for i, p in enumerate(config.get("providers", []))
+                 if p.get("name") == "Exo Local"),
+                None
             )
             
-            if exo_exists:
+            if exo_index is not None:
                 logger.info("Exo provider already exists in config")
                 # Update existing entry
-                for i, p in enumerate(config["providers"]):
-                    if p.get("name") == "Exo Local":
-                        config["providers"][i] = self.get_provider_config()
-                        break
+                config["providers"][exo_index] = self.get_provider_config()
             else:
                 # Add Exo as first provider (highest priority)
                 exo_config = self.get_provider_config()
@@ -148,7 +146,6 @@ class ExoTokenManagerIntegration:
     def remove_from_config(self) -> bool:
         """Remove Exo provider from configuration"""
         try:
-            import os
             config_file = os.path.expanduser(self.config_path)
             
             if not os.path.exists(config_file):
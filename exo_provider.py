@@ -9,12 +9,13 @@ with automatic node discovery, health monitoring, and failover support.
 import requests
 import json
 import logging
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple, Any
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -50,12 +51,12 @@ class ExoNode:
         """Get the full endpoint URL for this node"""
         return f"http://{self.host}:{self.port}"
     
-    def is_healthy(self, timeout_seconds: int = 30) -> bool:
+    def is_healthy(self, timeout_seconds: int = 30, now: Optional[datetime] = None) -> bool:
         """Check if node is responsive within timeout"""
         if self.status == ExoNodeStatus.OFFLINE:
             return False
         
-        time_since_seen = datetime.now() - self.last_seen
+        time_since_seen = (now or datetime.now()) - self.last_seen
         return time_since_seen.total_seconds() < timeout_seconds
 
 
@@ -98,7 +99,11 @@ class ExoClusterProvider:
         # Node management
         self.nodes: Dict[str, ExoNode] = {}
         self.available_models: List[str] = []
+        self._known_models: Set[str] = set()  # Fast membership check for available_models
+        self._models_etags: Dict[str, str] = {}  # node_id -> ETag of last /v1/models response
         self.is_cluster_available = False
+        self.session = requests.Session()  # Keep-alive connections to the nodes
+        self._last_health: Optional[Dict[str, Any]] = None  # Most recent check_cluster_health() result
         
         # Usage tracking
         self.total_requests = 0
@@ -169,34 +174,34 @@ class ExoClusterProvider:
         healthy_nodes = 0
         offline_nodes = 0
         
-        for node_id, node in list(self.nodes.items()):
-            try:
-                # Try to get node status
-                response = requests.get(
-                    f"{node.endpoint}/health",
-                    timeout=5
-                )
-                
-                if response.status_code == 200:
-                    node.status = ExoNodeStatus.ONLINE
-                    node.last_seen = datetime.now()
-                    healthy_nodes += 1
-                    
-                    # Update node info
-                    data = response.json()
-                    if "device_name" in data:
-                        node.device_name = data["device_name"]
-                    if "memory_gb" in data:
-                        node.memory_gb = data["memory_gb"]
-                else:
-                    node.status = ExoNodeStatus.DEGRADED
-            
-            except requests.exceptions.RequestException:
-                # Check if node has timed out
-                if not node.is_healthy(self.node_timeout):
+        # Probe all nodes concurrently so one slow node doesn't delay the sweep
+        nodes = list(self.nodes.items())
+        with ThreadPoolExecutor(max_workers=max(1, len(nodes))) as executor:
+            results = list(executor.map(self._probe_node, [node for _, node in nodes]))
+        
+        # One timestamp for the whole sweep
+        now = datetime.now()
+        for (node_id, node), result in zip(nodes, results):
+            if result is None:
+                # Check if node has timed out; only log the transition, not every sweep
+                if not node.is_healthy(self.node_timeout, now):
+                    if node.status != ExoNodeStatus.OFFLINE:
+                        logger.warning(f"Node {node_id} marked offline")
                     node.status = ExoNodeStatus.OFFLINE
                     offline_nodes += 1
-                    logger.warning(f"Node {node_id} marked offline")
+            elif result[0] == 200:
+                node.status = ExoNodeStatus.ONLINE
+                node.last_seen = now
+                healthy_nodes += 1
+                
+                # Update node info
+                data = result[1]
+                if "device_name" in data:
+                    node.device_name = data["device_name"]
+                if "memory_gb" in data:
+                    node.memory_gb = data["memory_gb"]
+            else:
+                node.status = ExoNodeStatus.DEGRADED
         
         # Update cluster availability
         self.is_cluster_available = healthy_nodes > 0
@@ -205,33 +210,58 @@ class ExoClusterProvider:
         if self.is_cluster_available:
             self._discover_models()
         
-        return {
+        self._last_health = {
             "healthy_nodes": healthy_nodes,
             "offline_nodes": offline_nodes,
             "total_nodes": len(self.nodes),
             "cluster_available": self.is_cluster_available,
             "available_models": self.available_models
         }
+        return self._last_health
+    
+    def _probe_node(self, node: ExoNode) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Query a node's health endpoint, returning (status_code, info) or None if unreachable"""
+        try:
+            response = self.session.get(f"{node.endpoint}/health", timeout=5)
+        except requests.exceptions.RequestException:
+            return None
+        
+        if response.status_code != 200:
+            return response.status_code, {}
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, {}
     
     def _discover_models(self):
         """Discover available models from healthy nodes"""
         for node in self.nodes.values():
             if node.status == ExoNodeStatus.ONLINE:
                 try:
-                    response = requests.get(
+                    # Conditional request: skip the body when the model list is unchanged
+                    etag = self._models_etags.get(node.id)
+                    response = self.session.get(
                         f"{node.endpoint}/v1/models",
+                        headers={"If-None-Match": etag} if etag else None,
                         timeout=5
                     )
                     
+                    if response.status_code == 304:
+                        return  # Models unchanged since last discovery
+                    
                     if response.status_code == 200:
                         data = response.json()
                         if "data" in data:
                             models = [m["id"] for m in data["data"]]
                             node.models = models
+                            # Only trust the ETag once its body has been parsed successfully
+                            if response.headers.get("ETag"):
+                                self._models_etags[node.id] = response.headers["ETag"]
                             
                             # Update global available models
                             for model in models:
-                                if model not in self.available_models:
+                                if model not in self._known_models:
+                                    self._known_models.add(model)
                                     self.available_models.append(model)
                             
                             logger.info(f"Discovered {len(models)} models on {node.id}")
@@ -288,15 +318,15 @@ class ExoClusterProvider:
         request_data.update(kwargs)
         
         # Make request
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{node.endpoint}/v1/chat/completions",
                 json=request_data,
                 timeout=120  # Allow time for inference
             )
             
-            compute_time = time.time() - start_time
+            compute_time = time.perf_counter() - start_time
             self.total_compute_time += compute_time
             self.total_requests += 1
             
@@ -334,7 +364,7 @@ class ExoClusterProvider:
             return []
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{node.endpoint}/v1/models",
                 timeout=10
             )
@@ -350,7 +380,10 @@ class ExoClusterProvider:
     
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive provider status"""
-        health = self.check_cluster_health()
+        # The monitoring thread keeps health current; only probe when it isn't running
+        health = self._last_health
+        if health is None or not self._running:
+            health = self.check_cluster_health()
         
         return {
             "provider": "Exo Local Cluster",
@@ -6,14 +6,41 @@ This module provides intelligent documentation search, context-aware assistance,
 and enhanced query capabilities using vector embeddings and semantic search.
 """
 
-import os
-import json
-import hashlib
+import heapq
+from collections import OrderedDict
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import re
 
+# Precompiled patterns used during indexing and answer extraction
+DOCSTRING_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+WORD_RE = re.compile(r'\b\w+\b')
+INSTRUCTION_LINE_RE = re.compile(r'^\d+\.|^[-*]\s|^###?\s')
+
+# Documentation files indexed by SimpleRAG, relative to docs_dir
+DOC_FILES = (
+    'README.md',
+    'DEPLOYMENT.md',
+    'USAGE_GUIDE.md',
+    'API_KEY_SETUP.md',
+    'AUTO_REFRESH_DOCS.md',
+    'QUICKSTART.md',
+    'EXO_QUICKSTART.md'
+)
+
+# Maximum number of (query, top_k) results kept by SimpleRAG.search
+SEARCH_CACHE_SIZE = 128
+
+# Common stop words excluded from keyword extraction
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'it', 'its', 'if', 'then', 'than', 'so'
+})
+
 @dataclass
 class Document:
     """Represents a document chunk for RAG"""
@@ -32,20 +59,22 @@ class SimpleRAG:
         self.docs_dir = Path(docs_dir)
         self.documents: List[Document] = []
         self.index: Dict[str, List[int]] = {}  # keyword -> document indices
+        self._lowered_content: List[str] = []  # lowercased document content, parallel to documents
+        self._search_cache: "OrderedDict[Tuple[str, int], List[Tuple[Document, float]]]" = OrderedDict()  # LRU of (query, top_k) -> results
+        self._loaded = False
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether documentation has been indexed"""
+        return self._loaded
         
     def load_documents(self):
-        """Load and index all documentation files"""
-        doc_files = [
-            'README.md',
-            'DEPLOYMENT.md',
-            'USAGE_GUIDE.md',
-            'API_KEY_SETUP.md',
-            'AUTO_REFRESH_DOCS.md',
-            'QUICKSTART.md',
-            'EXO_QUICKSTART.md'
-        ]
-        
-        for doc_file in doc_files:
+        """Load and index all documentation files (once)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        for doc_file in DOC_FILES:
             file_path = self.docs_dir / doc_file
             if file_path.exists():
                 self._index_document(file_path)
@@ -86,8 +115,7 @@ class SimpleRAG:
                 content = f.read()
             
             # Extract docstrings
-            docstring_pattern = r'"""(.*?)"""'
-            docstrings = re.findall(docstring_pattern, content, re.DOTALL)
+            docstrings = DOCSTRING_RE.findall(content)
             
             for docstring in docstrings:
                 if len(docstring.strip()) > 50:  # Only meaningful docstrings
@@ -131,54 +159,56 @@ class SimpleRAG:
     
     def _add_to_index(self, doc: Document, doc_idx: int):
         """Add document keywords to inverted index"""
+        self._search_cache.clear()  # Cached results are stale once the index changes
+        self._lowered_content.append(doc.content.lower())
         keywords = self._extract_keywords(doc.content)
         
         for keyword in keywords:
-            if keyword not in self.index:
-                self.index[keyword] = []
-            self.index[keyword].append(doc_idx)
+            self.index.setdefault(keyword, []).append(doc_idx)
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text"""
         # Convert to lowercase and split
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = WORD_RE.findall(text.lower())
         
         # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-                     'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                     'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
-                     'that', 'these', 'those', 'it', 'its', 'if', 'then', 'than', 'so'}
-        
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
+        keywords = [w for w in words if w not in STOP_WORDS and len(w) > 2]
         return keywords
     
     def search(self, query: str, top_k: int = 5) -> List[Tuple[Document, float]]:
         """Search for relevant documents"""
+        # Index documentation lazily on first search
+        self.load_documents()
+        
+        cache_key = (query, top_k)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self._search_cache.move_to_end(cache_key)
+            return list(cached)
+        
         query_keywords = self._extract_keywords(query)
         
         # Score documents based on keyword matches
         scores: Dict[int, float] = {}
         
         for keyword in query_keywords:
-            if keyword in self.index:
-                for doc_idx in self.index[keyword]:
-                    if doc_idx not in scores:
-                        scores[doc_idx] = 0
-                    scores[doc_idx] += 1
+            for doc_idx in self.index.get(keyword, ()):
+                scores[doc_idx] = scores.get(doc_idx, 0) + 1
         
         # Boost exact phrase matches
-        for doc_idx, doc in enumerate(self.documents):
-            if query.lower() in doc.content.lower():
-                if doc_idx not in scores:
-                    scores[doc_idx] = 0
-                scores[doc_idx] += 5
+        query_lower = query.lower()
+        for doc_idx, content_lower in enumerate(self._lowered_content):
+            if query_lower in content_lower:
+                scores[doc_idx] = scores.get(doc_idx, 0) + 5
         
-        # Sort by score and return top results
-        sorted_results = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        # Select top results without sorting every scored document
+        sorted_results = heapq.nlargest(top_k, scores.items(), key=lambda x: x[1])
         
         results = [(self.documents[idx], score) for idx, score in sorted_results]
-        return results
+        self._search_cache[cache_key] = results
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
     
     def get_context(self, query: str, max_tokens: int = 2000) -> str:
         """Get relevant context for a query"""
@@ -227,7 +257,7 @@ class SimpleRAG:
         instructions = []
         
         for i, line in enumerate(lines):
-            if re.match(r'^\d+\.|^[-*]\s|^###?\s', line.strip()):
+            if INSTRUCTION_LINE_RE.match(line.strip()):
                 instructions.append(line.strip())
             elif line.strip().startswith('```'):
                 # Include code blocks
@@ -7,12 +7,10 @@ Real-time status, health metrics, and manual control interface.
 """
 
 import streamlit as st
-import json
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 import plotly.graph_objects as go
-import plotly.express as px
-from typing import Dict, List, Any
+from typing import Dict
 import sys
 import os
 
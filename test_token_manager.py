@@ -172,6 +172,44 @@ def test_api_endpoints():
     
     return True
 
+# Test RAG search caching
+def test_rag_search_cache():
+    """Test that RAG search results are cached and invalidated on reindex"""
+    print("\n🔎 Testing RAG search cache...")
+    
+    sys.path.insert(0, os.path.dirname(__file__))
+    from rag_assistant import SimpleRAG, SEARCH_CACHE_SIZE
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        readme = Path(temp_dir) / "README.md"
+        readme.write_text("# Setup\nInstall the token manager with pip.\n")
+        
+        rag = SimpleRAG(temp_dir)
+        rag.load_documents()
+        
+        first = rag.search("token manager")
+        second = rag.search("token manager")
+        assert first == second, "Cached search returned different results"
+        assert first, "Expected at least one search result"
+        print(f"   ✓ Repeated search served from cache ({len(first)} results)")
+        
+        rag._index_document(readme)
+        assert not rag._search_cache, "Search cache not cleared after reindex"
+        print("   ✓ Cache cleared when index changes")
+        
+        for i in range(SEARCH_CACHE_SIZE + 10):
+            rag.search(f"token manager {i}")
+        assert len(rag._search_cache) == SEARCH_CACHE_SIZE, "Search cache grew past its bound"
+        print(f"   ✓ Cache bounded to {SEARCH_CACHE_SIZE} entries")
+        
+        lazy_rag = SimpleRAG(temp_dir)
+        assert not lazy_rag.is_loaded, "Documents loaded before first search"
+        assert lazy_rag.search("token manager"), "Lazy search returned no results"
+        assert lazy_rag.is_loaded, "Documents not loaded on first search"
+        print("   ✓ Documentation indexed lazily on first search")
+    
+    return True
+
 # Main test runner
 def run_all_tests():
     """Run all tests"""
@@ -186,6 +224,7 @@ def run_all_tests():
         ("File Operations", test_file_operations),
         ("Manager Import", test_manager_import),
         ("API Endpoints", test_api_endpoints),
+        ("RAG Search Cache", test_rag_search_cache),
     ]
     
     results = []